@@ -4,44 +4,84 @@
 import os
 import time
 import tkinter as tk
-from datetime import datetime
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional, Dict, List, Tuple, Any
-from PIL import Image, ImageDraw, ImageFont, ImageTk
+import numpy as np
+from PIL import Image, ImageFont, ImageTk
 
 from trains import loadDeparturesForStation
 from config import loadConfig
 from open import isRun
+from trains_fast import blit_clipped
+
+
+YELLOW = (255, 255, 0)
+
+# Horizontal bands of the 256x64 display that are uploaded to Tk independently:
+# first departure + calling at, second departure, third departure, clock
+DISPLAY_BANDS = ((0, 24), (24, 36), (36, 48), (48, 64))
+
+# Prefixes for the three visible departures when showDepartureNumbers is set
+DEPARTURE_PREFIXES = ("1st  ", "2nd  ", "3rd  ")
 
 
 class BitmapTextCache:
-    """Cache for rendered text bitmaps to improve performance"""
+    """Least-recently-used cache for rendered text bitmaps to improve performance"""
+    
+    def __init__(self, maxsize: int = 512) -> None:
+        # Keyed by (text, id(font)); fonts live as long as the board that owns them
+        self._cache: "OrderedDict[Tuple[str, int], Dict[str, Any]]" = OrderedDict()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+    
+    def get_bitmap_np(self, text: str, font: ImageFont.FreeTypeFont) -> Tuple[int, int, np.ndarray]:
+        """Get or create a boolean mask of lit pixels for the given text and font"""
+        cached = self._get_entry(text, font)
+        return cached['txt_width'], cached['txt_height'], cached['mask']
     
-    def __init__(self) -> None:
-        self._cache: Dict[str, Dict[str, Any]] = {}
+    def get_glyph_np(self, text: str, font: ImageFont.FreeTypeFont) -> Tuple[int, np.ndarray, int]:
+        """Get the width, lit-pixel mask and horizontal advance of the given text in one lookup"""
+        cached = self._get_entry(text, font)
+        if cached['advance'] is None:
+            cached['advance'] = int(font.getlength(text))
+        return cached['txt_width'], cached['mask'], cached['advance']
     
-    def get_bitmap(self, text: str, font: ImageFont.FreeTypeFont) -> Tuple[int, int, Image.Image]:
-        """Get or create a bitmap for the given text and font"""
-        name_tuple = font.getname()
-        font_key = ''.join(name_tuple)
-        key = text + font_key
-        
-        if key in self._cache:
-            cached = self._cache[key]
-            return cached['txt_width'], cached['txt_height'], cached['bitmap']
-        
-        # Create new bitmap
-        _, _, txt_width, txt_height = font.getbbox(text)
-        bitmap = Image.new('L', (txt_width, txt_height), color=0)
-        draw = ImageDraw.Draw(bitmap)
-        draw.text((0, 0), text=text, font=font, fill=255)
-        
-        self._cache[key] = {
-            'bitmap': bitmap,
+    def _get_entry(self, text: str, font: ImageFont.FreeTypeFont) -> Dict[str, Any]:
+        """Look up a cache entry, rasterising the text on a miss"""
+        key = (text, id(font))
+        
+        cached = self._cache.get(key)
+        if cached is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return cached
+        self.misses += 1
+        
+        # Rasterise straight to a mask; its offset and size give the same
+        # (0, 0, right, bottom) box that getbbox() would report
+        core, (offset_x, offset_y) = font.getmask2(text, mode='L')
+        glyph_width, glyph_height = core.size
+        txt_width = max(offset_x + glyph_width, 0)
+        txt_height = max(offset_y + glyph_height, 0)
+        mask = np.zeros((txt_height, txt_width), dtype=bool)
+        if glyph_width and glyph_height:
+            glyphs = np.asarray(Image.Image()._new(core))
+            x0, y0 = max(offset_x, 0), max(offset_y, 0)
+            mask[y0:, x0:] = glyphs[y0 - offset_y:, x0 - offset_x:] > 0
+        
+        cached = {
+            'mask': mask,
             'txt_width': txt_width,
-            'txt_height': txt_height
+            'txt_height': txt_height,
+            'advance': None
         }
+        self._cache[key] = cached
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
         
-        return txt_width, txt_height, bitmap
+        return cached
 
 
 class DepartureBoard:
@@ -49,6 +89,21 @@ class DepartureBoard:
     
     def __init__(self, config: Dict[str, Any]) -> None:
         self.config = config
+        # Config is fixed for the life of the board; hoist values used every frame
+        self._show_numbers: bool = config["showDepartureNumbers"]
+        self._first_bold: bool = config["firstDepartureBold"]
+        self._refresh_time: int = config["refreshTime"]
+        self._frame_period: float = 1.0 / config["targetFPS"]
+        self._out_of_hours_name: str = config["journey"].get("outOfHoursName", "")
+        # Operating hours as (start_hour, end_hour), or None to run all day
+        self._op_hours: Optional[Tuple[int, int]] = None
+        operating_hours = config["api"]["operatingHours"]
+        if operating_hours:
+            match = config["hoursPattern"].match(operating_hours)
+            if match:
+                self._op_hours = (int(match.group(2)), int(match.group(3)))
+            else:
+                print(f"Warning: ignoring invalid operatingHours '{operating_hours}' (expected e.g. 6-23)")
         self.root = tk.Tk()
         self.root.title("UK Train Departure Display")
         
@@ -72,10 +127,37 @@ class DepartureBoard:
         
         # Initialize state
         self.bitmap_cache = BitmapTextCache()
-        self.current_image: Optional[ImageTk.PhotoImage] = None
-        self.canvas_item_id: Optional[int] = None  # Store canvas item ID to reuse
+        self.frame = np.zeros((64, 256, 3), dtype=np.uint8)
+        # Lit pixels of the frame being composed; coloured in one pass at the end
+        self.lit = np.zeros((64, 256), dtype=bool)
+        if blit_clipped is not None:
+            # Load the compiled blit kernel now rather than on the first frame
+            blit_clipped(self.lit, np.zeros((1, 1), dtype=bool), 0, 0, 0, 0, 0, 0)
+        
+        # Last frame uploaded to Tk, used to find the bands that changed
+        self._shown_frame = np.zeros_like(self.frame)
+        
+        # One persistent Tk image and canvas item per display band, updated in place
+        self.band_images: List[ImageTk.PhotoImage] = []
+        self.band_item_ids: List[int] = []
+        for y_start, y_end in DISPLAY_BANDS:
+            band_image = ImageTk.PhotoImage(
+                Image.new('RGB', (self.display_width, (y_end - y_start) * self.scale_factor))
+            )
+            self.band_images.append(band_image)
+            self.band_item_ids.append(
+                self.canvas.create_image(0, y_start * self.scale_factor, anchor=tk.NW, image=band_image)
+            )
+        
         self.departure_data: Optional[List[Dict[str, Any]]] = None
         self.station_name: str = ""
+        # Pre-rasterised "calling at" strip for the first departure
+        self._scroll_mask: Optional[np.ndarray] = None
+        self._scroll_w = 0
+        self._scroll_h = 0
+        # Last laid-out HH:MM clock text
+        self._last_hm: Optional[str] = None
+        self._last_hm_layout: Tuple[int, List[Tuple[int, np.ndarray]]] = (0, [])
         
         # Animation state for scrolling text
         self.pixels_left = 1
@@ -85,7 +167,12 @@ class DepartureBoard:
         self.station_render_count = 0
         
         # Timing
-        self.last_refresh = time.time() - config["refreshTime"]
+        self.last_refresh = time.time() - self._refresh_time
+        self._next_deadline = time.monotonic()
+        
+        # API calls run on a worker thread so slow responses don't stall frames
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending_future: Optional[Future] = None
         
         # Bind close event
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
@@ -109,61 +196,78 @@ class DepartureBoard:
     
     def _on_close(self) -> None:
         """Handle window close event"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
         self.root.quit()
     
     def render_frame(self) -> None:
         """Render a single frame of the departure board"""
-        # Create image buffer
-        img = Image.new('RGB', (256, 64), color='black')
-        draw = ImageDraw.Draw(img)
+        # Clear the lit-pixel mask
+        lit = self.lit
+        lit.fill(False)
         
-        # Check if we need to refresh data
+        # Start a background refresh when due, and apply it once it completes
         current_time = time.time()
-        if current_time - self.last_refresh >= self.config["refreshTime"]:
-            self._refresh_data()
+        if self._pending_future is None and current_time - self.last_refresh >= self._refresh_time:
+            self._pending_future = self._executor.submit(self._fetch_departures)
             self.last_refresh = current_time
+        if self._pending_future is not None and self._pending_future.done():
+            future, self._pending_future = self._pending_future, None
+            self._apply_refresh(future)
         
         # Draw departure board
         if self.departure_data is None or len(self.departure_data) == 0:
-            self._draw_no_trains(draw)
+            self._draw_no_trains(lit)
         else:
-            self._draw_departures(draw)
+            self._draw_departures(lit)
         
         # Draw time at bottom
-        self._draw_time(draw)
-        
-        # Scale up the image
-        img = img.resize((self.display_width, self.display_height), Image.NEAREST)
-        
-        # Convert to PhotoImage and display
-        self.current_image = ImageTk.PhotoImage(img)
-
-        # Reuse canvas item instead of creating new ones
-        if self.canvas_item_id is None:
-            # Create canvas item only once
-            self.canvas_item_id = self.canvas.create_image(0, 0, anchor=tk.NW, image=self.current_image)
-        else:
-            # Update existing canvas item
-            self.canvas.itemconfig(self.canvas_item_id, image=self.current_image)
+        self._draw_time(lit)
+        
+        # Colour every lit pixel in a single pass
+        frame = self.frame
+        frame.fill(0)
+        frame[lit] = YELLOW
+        
+        # Scale and upload only the bands that changed since the last frame
+        for band_image, (y_start, y_end) in zip(self.band_images, DISPLAY_BANDS):
+            band = frame[y_start:y_end]
+            if np.array_equal(band, self._shown_frame[y_start:y_end]):
+                continue
+            self._shown_frame[y_start:y_end] = band
+            
+            # PIL's nearest-neighbour resize is several times faster than a
+            # NumPy repeat()-based 2x upscale for this frame size.
+            img = Image.fromarray(band).resize(
+                (self.display_width, (y_end - y_start) * self.scale_factor), Image.NEAREST
+            )
+            band_image.paste(img)
 
     def _refresh_data(self) -> None:
-        """Refresh departure data from API"""
+        """Refresh departure data from API, waiting for the result"""
+        self._apply_refresh(self._executor.submit(self._fetch_departures))
+        self.last_refresh = time.time()
+    
+    def _fetch_departures(self) -> Optional[Tuple[Any, str, str]]:
+        """Load departures on the worker thread; returns None outside operating hours"""
+        # Check operating hours
+        if self._op_hours and not isRun(*self._op_hours):
+            return None
+        
+        return loadDeparturesForStation(
+            self.config["journey"],
+            self.config["api"]["apiKey"],
+            "10"
+        )
+    
+    def _apply_refresh(self, future: Future) -> None:
+        """Apply the result of a completed departure fetch (runs on the Tk thread)"""
         try:
-            # Check operating hours
-            if self.config["api"]["operatingHours"]:
-                hours = self.config["api"]["operatingHours"].split('-')
-                if len(hours) == 2:
-                    if not isRun(int(hours[0]), int(hours[1])):
-                        self.departure_data = []
-                        return
-            
-            # Load data
-            departures, station, dest_station = loadDeparturesForStation(
-                self.config["journey"],
-                self.config["api"]["apiKey"],
-                "10"
-            )
+            result = future.result()
+            if result is None:
+                self.departure_data = []
+                return
             
+            departures, station, dest_station = result
             self.departure_data = departures
             self.station_name = station
             self.root.title(f"{station}{f' to {dest_station}' if dest_station else ''} - Departures")
@@ -176,6 +280,16 @@ class DepartureBoard:
                     if dep.get('platform') == platform
                 ]
             
+            # Build row strings once per refresh rather than every frame
+            for index, departure in enumerate((self.departure_data or [])[:len(DEPARTURE_PREFIXES)]):
+                self._prepare_row_text(departure, index)
+            
+            # Rasterise the scrolling calling points once per refresh
+            if self.departure_data:
+                self._scroll_w, self._scroll_h, self._scroll_mask = self.bitmap_cache.get_bitmap_np(
+                    self.departure_data[0]["calling_at_list"], self.font
+                )
+            
             # Reset animation state
             self.pixels_left = 1
             self.pixels_up = 0
@@ -187,27 +301,27 @@ class DepartureBoard:
             print(f"Error loading data: {e}")
             self.departure_data = []
     
-    def _draw_departures(self, draw: ImageDraw.ImageDraw) -> None:
+    def _draw_departures(self, lit: np.ndarray) -> None:
         """Draw departure information"""
         departures = self.departure_data or []
         if len(departures) == 0:
             return
         
         # First departure (row 1 & 2)
-        first_font = self.font_bold if self.config['firstDepartureBold'] else self.font
-        self._draw_departure_row(draw, departures[0], 0, first_font, show_calling=True)
+        first_font = self.font_bold if self._first_bold else self.font
+        self._draw_departure_row(lit, departures[0], 0, first_font, show_calling=True)
         
         # Second departure (row 3)
         if len(departures) > 1:
-            self._draw_departure_row(draw, departures[1], 24, self.font, show_calling=False)
+            self._draw_departure_row(lit, departures[1], 24, self.font, show_calling=False)
         
         # Third departure (row 4)
         if len(departures) > 2:
-            self._draw_departure_row(draw, departures[2], 36, self.font, show_calling=False)
+            self._draw_departure_row(lit, departures[2], 36, self.font, show_calling=False)
     
     def _draw_departure_row(
         self,
-        draw: ImageDraw.ImageDraw,
+        lit: np.ndarray,
         departure: Dict[str, Any],
         y_pos: int,
         font: ImageFont.FreeTypeFont,
@@ -215,57 +329,54 @@ class DepartureBoard:
     ) -> None:
         """Draw a single departure row"""
         # Time and destination
-        time_str = departure["aimed_departure_time"]
-        dest_str = departure["destination_name"]
-        
-        if self.config["showDepartureNumbers"] and y_pos == 0:
-            train_text = f"1st  {time_str}  {dest_str}"
-        elif self.config["showDepartureNumbers"] and y_pos == 24:
-            train_text = f"2nd  {time_str}  {dest_str}"
-        elif self.config["showDepartureNumbers"] and y_pos == 36:
-            train_text = f"3rd  {time_str}  {dest_str}"
-        else:
-            train_text = f"{time_str}  {dest_str}"
-        
-        w, h, bitmap = self.bitmap_cache.get_bitmap(train_text, font)
-        self._draw_bitmap(draw, 0, y_pos, bitmap)
+        w, h, bitmap = self.bitmap_cache.get_bitmap_np(departure["_train_text"], font)
+        self._draw_bitmap(lit, 0, y_pos, bitmap)
         
         # Status
-        status_text = self._get_status_text(departure)
-        w_status, h_status, status_bitmap = self.bitmap_cache.get_bitmap(status_text, self.font)
-        self._draw_bitmap(draw, 256 - w_status, y_pos, status_bitmap)
+        w_status, h_status, status_bitmap = self.bitmap_cache.get_bitmap_np(departure["_status_text"], self.font)
+        self._draw_bitmap(lit, 256 - w_status, y_pos, status_bitmap)
         
         # Platform (if available)
-        if "platform" in departure:
-            platform_text = "BUS" if departure["platform"].lower() == "bus" else f"Plat {departure['platform']}"
-            w_plat, h_plat, plat_bitmap = self.bitmap_cache.get_bitmap(platform_text, self.font)
-            self._draw_bitmap(draw, 256 - w_status - w_plat - 5, y_pos, plat_bitmap)
+        if departure["_platform_text"] is not None:
+            w_plat, h_plat, plat_bitmap = self.bitmap_cache.get_bitmap_np(departure["_platform_text"], self.font)
+            self._draw_bitmap(lit, 256 - w_status - w_plat - 5, y_pos, plat_bitmap)
         
         # Calling at (for first departure only)
         if show_calling:
             calling_text = "Calling at: "
-            w_call, h_call, call_bitmap = self.bitmap_cache.get_bitmap(calling_text, self.font)
-            self._draw_bitmap(draw, 0, y_pos + 12, call_bitmap)
+            w_call, h_call, call_bitmap = self.bitmap_cache.get_bitmap_np(calling_text, self.font)
+            self._draw_bitmap(lit, 0, y_pos + 12, call_bitmap)
             
             # Scrolling stations text
-            stations = departure["calling_at_list"]
-            self._draw_scrolling_text(draw, stations, w_call, y_pos + 12, 256 - w_call)
+            self._draw_scrolling_text(lit, w_call, y_pos + 12, 256 - w_call)
+
+    def _prepare_row_text(self, departure: Dict[str, Any], index: int) -> None:
+        """Precompute the strings shown on a departure row and attach them to the departure"""
+        prefix = DEPARTURE_PREFIXES[index] if self._show_numbers else ""
+        departure["_train_text"] = f"{prefix}{departure['aimed_departure_time']}  {departure['destination_name']}"
+        departure["_status_text"] = self._get_status_text(departure)
+        
+        departure["_platform_text"] = None
+        if "platform" in departure:
+            departure["_platform_text"] = "BUS" if departure["platform"].lower() == "bus" else f"Plat {departure['platform']}"
 
     def _draw_scrolling_text(
             self,
-            draw: ImageDraw.ImageDraw,
-            text: str,
+            lit: np.ndarray,
             x_offset: int,
             y_pos: int,
             max_width: int
     ) -> None:
-        """Draw scrolling text with animation"""
-        w, h, bitmap = self.bitmap_cache.get_bitmap(text, self.font)
+        """Draw the pre-rasterised calling points strip with scrolling animation"""
+        w, h, bitmap = self._scroll_w, self._scroll_h, self._scroll_mask
+        if bitmap is None:
+            return
 
         if self.has_elevated:
-            # Scroll left
-            x_pos = x_offset + self.pixels_left - 1
-            self._draw_bitmap_clipped(draw, x_pos, y_pos, bitmap, x_offset, max_width)
+            # Scroll left by blitting only the visible window of the strip
+            src_x = 1 - self.pixels_left
+            visible = bitmap[:, src_x:src_x + max_width]
+            self._draw_bitmap_clipped(lit, x_offset, y_pos, visible, x_offset, max_width)
             if -self.pixels_left > w and self.pause_count < 8:
                 self.pause_count += 1
                 self.pixels_left = 0
@@ -275,7 +386,7 @@ class DepartureBoard:
                 self.pixels_left -= 1
         else:
             # Scroll up
-            self._draw_bitmap_clipped(draw, x_offset, y_pos + h - self.pixels_up, bitmap, x_offset, max_width)
+            self._draw_bitmap_clipped(lit, x_offset, y_pos + h - self.pixels_up, bitmap, x_offset, max_width)
             if self.pixels_up == h:
                 self.pause_count += 1
                 if self.pause_count > 100:
@@ -286,48 +397,53 @@ class DepartureBoard:
 
     def _draw_bitmap_clipped(
             self,
-            draw: ImageDraw.ImageDraw,
+            lit: np.ndarray,
             x: int,
             y: int,
-            bitmap: Image.Image,
+            mask: np.ndarray,
             clip_x_start: int,
             clip_width: int
     ) -> None:
-        """Draw a monochrome bitmap with yellow color, clipped to a specific region"""
-        pixels = bitmap.load()
-        clip_x_end = clip_x_start + clip_width
-
+        """Mark a text mask as lit, clipped to a specific region"""
         # Vertical clipping - only show within the line (y_pos to y_pos + 10)
-        clip_y_start = y
-        clip_y_end = y + 10  # Each line is 10 pixels tall
-
-        for py in range(bitmap.height):
-            for px in range(bitmap.width):
-                if pixels[px, py] > 0:
-                    screen_x = x + px
-                    screen_y = y + py
-                    # Only draw if within clip region (both horizontal and vertical) and screen bounds
-                    if (clip_x_start <= screen_x < clip_x_end and
-                            clip_y_start <= screen_y < clip_y_end and
-                            0 <= screen_x < 256 and
-                            0 <= screen_y < 22):
-                        draw.point((screen_x, screen_y), fill='yellow')
+        # and above the second row boundary
+        self._blit(lit, x, y, mask, clip_x_start, clip_x_start + clip_width, y, min(y + 10, 22))
     
     def _draw_bitmap(
         self,
-        draw: ImageDraw.ImageDraw,
+        lit: np.ndarray,
         x: int,
         y: int,
-        bitmap: Image.Image
+        mask: np.ndarray
     ) -> None:
-        """Draw a monochrome bitmap with yellow color"""
-        # Convert bitmap to yellow on black
-        pixels = bitmap.load()
-        for py in range(bitmap.height):
-            for px in range(bitmap.width):
-                if pixels[px, py] > 0:
-                    if 0 <= x + px < 256 and 0 <= y + py < 64:
-                        draw.point((x + px, y + py), fill='yellow')
+        """Mark a text mask as lit"""
+        self._blit(lit, x, y, mask, 0, 256, 0, 64)
+    
+    @staticmethod
+    def _blit(
+        lit: np.ndarray,
+        x: int,
+        y: int,
+        mask: np.ndarray,
+        clip_x_start: int,
+        clip_x_end: int,
+        clip_y_start: int,
+        clip_y_end: int
+    ) -> None:
+        """OR a mask into the lit-pixel mask within a clip rectangle"""
+        if blit_clipped is not None:
+            blit_clipped(lit, mask, x, y, clip_x_start, clip_x_end, clip_y_start, clip_y_end)
+            return
+        
+        mask_height, mask_width = mask.shape
+        sx0 = max(x, clip_x_start, 0)
+        sx1 = min(x + mask_width, clip_x_end, 256)
+        sy0 = max(y, clip_y_start, 0)
+        sy1 = min(y + mask_height, clip_y_end, 64)
+        if sx0 >= sx1 or sy0 >= sy1:
+            return
+        
+        lit[sy0:sy1, sx0:sx1] |= mask[sy0 - y:sy1 - y, sx0 - x:sx1 - x]
     
     def _get_status_text(self, departure: Dict[str, Any]) -> str:
         """Get status text for a departure"""
@@ -345,45 +461,75 @@ class DepartureBoard:
         else:
             return "On time"
     
-    def _draw_no_trains(self, draw: ImageDraw.ImageDraw) -> None:
+    def _draw_no_trains(self, lit: np.ndarray) -> None:
         """Draw 'no trains' message"""
-        station_text = self.station_name or self.config["journey"].get("outOfHoursName", "")
+        station_text = self.station_name or self._out_of_hours_name
         
         # Welcome to
         text1 = "Welcome to"
-        w1, h1, bmp1 = self.bitmap_cache.get_bitmap(text1, self.font_bold)
-        self._draw_bitmap(draw, (256 - w1) // 2, 5, bmp1)
+        w1, h1, bmp1 = self.bitmap_cache.get_bitmap_np(text1, self.font_bold)
+        self._draw_bitmap(lit, (256 - w1) // 2, 5, bmp1)
         
         # Station name
-        w2, h2, bmp2 = self.bitmap_cache.get_bitmap(station_text, self.font_bold)
-        self._draw_bitmap(draw, (256 - w2) // 2, 17, bmp2)
+        w2, h2, bmp2 = self.bitmap_cache.get_bitmap_np(station_text, self.font_bold)
+        self._draw_bitmap(lit, (256 - w2) // 2, 17, bmp2)
         
         # No trains message
         text3 = "No trains scheduled"
-        w3, h3, bmp3 = self.bitmap_cache.get_bitmap(text3, self.font)
-        self._draw_bitmap(draw, (256 - w3) // 2, 35, bmp3)
+        w3, h3, bmp3 = self.bitmap_cache.get_bitmap_np(text3, self.font)
+        self._draw_bitmap(lit, (256 - w3) // 2, 35, bmp3)
     
-    def _draw_time(self, draw: ImageDraw.ImageDraw) -> None:
+    def _draw_time(self, lit: np.ndarray) -> None:
         """Draw current time at bottom of display"""
-        now = datetime.now().time()
-        hour, minute, second = str(now).split('.')[0].split(':')
-        
-        hm_text = f"{hour}:{minute}"
-        s_text = f":{second}"
-        
-        w1, h1, hm_bitmap = self.bitmap_cache.get_bitmap(hm_text, self.font_bold_large)
-        w2, h2, s_bitmap = self.bitmap_cache.get_bitmap(s_text, self.font_bold_tall)
+        now = time.localtime()
+        hm_text = f"{now.tm_hour:02d}:{now.tm_min:02d}"
+        s_text = f":{now.tm_sec:02d}"
+        
+        # Compose the clock from per-character glyphs so the cache only ever
+        # holds the digits and colon rather than every time of day
+        # HH:MM only changes once a minute, so reuse its layout until then
+        if hm_text != self._last_hm:
+            self._last_hm = hm_text
+            self._last_hm_layout = self._layout_glyphs(hm_text, self.font_bold_large)
+        w1, hm_glyphs = self._last_hm_layout
+        w2, s_glyphs = self._layout_glyphs(s_text, self.font_bold_tall)
         
         total_width = w1 + w2
         start_x = (256 - total_width) // 2
         
-        self._draw_bitmap(draw, start_x, 50, hm_bitmap)
-        self._draw_bitmap(draw, start_x + w1, 55, s_bitmap)
+        for dx, glyph in hm_glyphs:
+            self._draw_bitmap(lit, start_x + dx, 50, glyph)
+        for dx, glyph in s_glyphs:
+            self._draw_bitmap(lit, start_x + w1 + dx, 55, glyph)
+    
+    def _layout_glyphs(
+        self,
+        text: str,
+        font: ImageFont.FreeTypeFont
+    ) -> Tuple[int, List[Tuple[int, np.ndarray]]]:
+        """Lay out text one character at a time, returning its width and (x offset, mask) pairs"""
+        glyphs = []
+        x = 0
+        width = 0
+        for char in text:
+            w, mask, advance = self.bitmap_cache.get_glyph_np(char, font)
+            glyphs.append((x, mask))
+            width = x + w
+            x += advance
+        return width, glyphs
     
     def update(self) -> None:
         """Update the display (called by animation loop)"""
         self.render_frame()
-        self.root.after(int(1000 / self.config["targetFPS"]), self.update)
+        
+        # Schedule against a fixed cadence so timer jitter doesn't accumulate
+        now = time.monotonic()
+        self._next_deadline += self._frame_period
+        if self._next_deadline < now:
+            # Render overran the frame budget; resync rather than queue catch-up frames
+            self._next_deadline = now
+        delay = max(1, int((self._next_deadline - now) * 1000))
+        self.root.after(delay, self.update)
     
     def run(self) -> None:
         """Start the application"""
@@ -396,6 +542,7 @@ class DepartureBoard:
         self._refresh_data()
         
         # Start animation loop
+        self._next_deadline = time.monotonic()
         self.root.after(0, self.update)
         
         # Run main loop
@@ -4,6 +4,9 @@ import xmltodict
 
 from typing import Dict, List, Optional, Tuple, Any
 
+# Seconds to wait for the departures API before giving up on a refresh
+API_TIMEOUT = 20
+
 
 def removeBrackets(originalName):
     return re.split(r" \(", originalName)[0]
@@ -236,7 +239,7 @@ def loadDeparturesForStation(journeyConfig, apiKey, rows):
     headers = {'Content-Type': 'text/xml'}
     apiURL = "https://lite.realtime.nationalrail.co.uk/OpenLDBWS/ldb11.asmx"
 
-    APIOut = requests.post(apiURL, data=APIRequest, headers=headers).text
+    APIOut = requests.post(apiURL, data=APIRequest, headers=headers, timeout=API_TIMEOUT).text
 
     Departures, departureStationName, destinationStationName = ProcessDepartures(journeyConfig, APIOut)
 
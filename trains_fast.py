@@ -0,0 +1,33 @@
+"""Optional Numba-compiled pixel kernels for the departure board renderer"""
+
+try:
+    from numba import njit, types
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+    # Compile eagerly for both contiguous cached masks and the strided slices
+    # used while scrolling, so no frame pays for JIT compilation
+    _BLIT_ARGS = (types.int64,) * 6
+    _BLIT_SIGNATURES = [
+        (types.boolean[:, ::1], types.boolean[:, ::1]) + _BLIT_ARGS,
+        (types.boolean[:, ::1], types.boolean[:, :]) + _BLIT_ARGS,
+    ]
+
+    @njit(_BLIT_SIGNATURES, cache=True)
+    def blit_clipped(lit, mask, x, y, clip_x_start, clip_x_end, clip_y_start, clip_y_end):
+        """OR a mask placed at (x, y) into a lit-pixel mask within a clip rectangle"""
+        mask_height, mask_width = mask.shape
+        frame_height, frame_width = lit.shape
+        sx0 = max(x, clip_x_start, 0)
+        sx1 = min(x + mask_width, clip_x_end, frame_width)
+        sy0 = max(y, clip_y_start, 0)
+        sy1 = min(y + mask_height, clip_y_end, frame_height)
+
+        for sy in range(sy0, sy1):
+            for sx in range(sx0, sx1):
+                if mask[sy - y, sx - x]:
+                    lit[sy, sx] = True
+else:
+    blit_clipped = None